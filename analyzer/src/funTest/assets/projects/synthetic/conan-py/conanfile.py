@@ -44,35 +44,36 @@ class PocoConan(ConanFile):
                "poco_unbundled": [True, False],
                "cxx_14": [True, False]
               }
-    default_options = '''
-shared=False
-fPIC=True
-enable_xml=True
-enable_json=True
-enable_mongodb=True
-enable_pdf=False
-enable_util=True
-enable_net=True
-enable_netssl=True
-enable_netssl_win=True
-enable_crypto=True
-enable_data=True
-enable_data_sqlite=True
-enable_data_mysql=False
-enable_data_odbc=False
-enable_sevenzip=False
-enable_zip=True
-enable_apacheconnector=False
-enable_cppparser=False
-enable_pocodoc=False
-enable_pagecompiler=False
-enable_pagecompiler_file2page=False
-enable_redis=True
-force_openssl=True
-enable_tests=False
-poco_unbundled=False
-cxx_14=False
-'''
+    default_options = {"shared": False,
+                       "fPIC": True,
+                       "enable_xml": True,
+                       "enable_json": True,
+                       "enable_mongodb": True,
+                       "enable_pdf": False,
+                       "enable_util": True,
+                       "enable_net": True,
+                       "enable_netssl": True,
+                       "enable_netssl_win": True,
+                       "enable_crypto": True,
+                       "enable_data": True,
+                       "enable_data_sqlite": True,
+                       "enable_data_mysql": False,
+                       "enable_data_odbc": False,
+                       "enable_sevenzip": False,
+                       "enable_zip": True,
+                       "enable_apacheconnector": False,
+                       "enable_cppparser": False,
+                       "enable_pocodoc": False,
+                       "enable_pagecompiler": False,
+                       "enable_pagecompiler_file2page": False,
+                       "enable_redis": True,
+                       "force_openssl": True,
+                       "enable_tests": False,
+                       "poco_unbundled": False,
+                       "cxx_14": False
+                      }
+    # The CMake variables for all options that are passed through as is, "shared" is inverted and "fPIC" is not passed.
+    _cmake_option_variables = {name: name.upper() for name in options if name not in ("shared", "fPIC")}
 
     def source(self):
         zip_name = "poco-%s-release.zip" % self.version
@@ -112,12 +113,9 @@ cxx_14=False
             tools.replace_in_file("poco/Crypto/CMakeLists.txt", replace, replace + " ws2_32 Crypt32.lib")
 
         cmake = CMake(self, parallel=None)  # Parallel crashes building
-        for option_name in self.options.values.fields:
-            activated = getattr(self.options, option_name)
-            if option_name == "shared":
-                cmake.definitions["POCO_STATIC"] = "OFF" if activated else "ON"
-            elif not option_name == "fPIC":
-                cmake.definitions[option_name.upper()] = "ON" if activated else "OFF"
+        cmake.definitions["POCO_STATIC"] = "OFF" if self.options.shared else "ON"
+        cmake.definitions.update({variable: "ON" if getattr(self.options, option_name) else "OFF"
+                                  for option_name, variable in self._cmake_option_variables.items()})
 
         if self.settings.os == "Windows" and self.settings.compiler == "Visual Studio":  # MT or MTd
             cmake.definitions["POCO_MT"] = "ON" if "MT" in str(self.settings.compiler.runtime) else "OFF"
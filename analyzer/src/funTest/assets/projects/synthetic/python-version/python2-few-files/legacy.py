@@ -0,0 +1,2 @@
+def legacy():
+    print "legacy"
@@ -0,0 +1,56 @@
+/*
+ * Copyright (C) 2021 HERE Europe B.V.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     https://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ * License-Filename: LICENSE
+ */
+
+package org.ossreviewtoolkit.analyzer.managers
+
+import io.kotest.core.spec.style.WordSpec
+import io.kotest.matchers.shouldBe
+
+import java.io.File
+
+import org.ossreviewtoolkit.utils.test.createTestTempDir
+
+private val PROJECTS_DIR = File("src/funTest/assets/projects/synthetic/python-version").absoluteFile
+
+class PythonVersionFunTest : WordSpec({
+    "getPythonVersion()" should {
+        "detect Python 2 for a project with few files of which one is incompatible with Python 3" {
+            PythonVersion.getPythonVersion(PROJECTS_DIR.resolve("python2-few-files")) shouldBe 2
+        }
+
+        "detect Python 2 for a project with many files of which one is incompatible with Python 3" {
+            val projectDir = createTestTempDir()
+            repeat(100) { projectDir.resolve("m$it.py").writeText("x = $it\n") }
+            projectDir.resolve("legacy.py").writeText("print \"x\"\n")
+
+            PythonVersion.getPythonVersion(projectDir) shouldBe 2
+        }
+
+        "detect Python 3 for a project with many files that are all compatible with Python 3" {
+            val projectDir = createTestTempDir()
+            repeat(100) { projectDir.resolve("m$it.py").writeText("x = $it\n") }
+
+            PythonVersion.getPythonVersion(projectDir) shouldBe 3
+        }
+
+        "detect Python 3 for a project with a file that declares a non-UTF-8 encoding" {
+            PythonVersion.getPythonVersion(PROJECTS_DIR.resolve("python3-latin-1")) shouldBe 3
+        }
+    }
+})
@@ -24,36 +24,107 @@ import ast
 import os
 import logging
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
-parser = ArgumentParser()
-parser.add_argument("-d", "--directory", dest="directory", help="A Python project directory.", metavar="DIR")
+# The number of files to check per worker process task, to keep the inter-process communication overhead low.
+CHUNK_SIZE = 32
 
-args = parser.parse_args()
 
-
-def compatible_python3(file_path):
+def compatible_python3(file_content, file_path):
     try:
-        return ast.parse(file_path)
-    except SyntaxError as e:
+        # Only parse the file, as compiling it would also reject valid Python 3 syntax in an invalid context, like
+        # top-level "await" in scripts exported from notebooks.
+        ast.parse(file_content, file_path)
+        return True
+    except SyntaxError:
         return False
 
 
+def find_python_files(path):
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        # Like os.walk(), silently skip directories that cannot be listed.
+        return
+
+    with entries:
+        for entry in entries:
+            # Use the file type information cached by scandir() to avoid additional stat calls. Like os.walk(), do not
+            # descend into symbolic links to directories.
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_python_files(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                yield entry.path
+
+
+def find_incompatible_file(file_paths):
+    for file_path in file_paths:
+        # Read the raw bytes and let the parser decode them, which also respects PEP 263 encoding declarations.
+        with open(file_path, "rb") as file:
+            file_content = file.read()
+
+        if not compatible_python3(file_content, file_path):
+            return file_path
+
+    return None
+
+
+def available_cpus():
+    # Unlike os.cpu_count(), this respects restrictions of the CPUs the process may run on, e.g. in containers.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def find_incompatible_file_in_parallel(chunks):
+    # Do not start more worker processes than there are chunks, as e.g. on Linux all of them are started right away.
+    with ProcessPoolExecutor(max_workers=min(len(chunks), available_cpus())) as executor:
+        futures = [executor.submit(find_incompatible_file, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            incompatible_file = future.result()
+            if incompatible_file:
+                # Skip the chunks that are still queued. Leaving the executor still waits for the running chunks.
+                for pending in futures:
+                    pending.cancel()
+                return incompatible_file
+
+    return None
+
+
 def project_compatibility(path):
-    for root, dirs, files in os.walk(path):
-        for file in files:
-            if file.endswith(".py"):
-                file_path = os.path.join(root, file)
-                file_content = open(file_path, encoding="UTF-8").read()
-                if not compatible_python3(file_content):
-                    logging.debug("At least one file is incompatible with Python 3: " + file_path)
-                    logging.debug("Assuming the project in '" + path + "' to be Python 2.")
-                    return 2
+    file_paths = list(find_python_files(path))
+
+    chunks = [file_paths[i:i + CHUNK_SIZE] for i in range(0, len(file_paths), CHUNK_SIZE)]
+
+    if min(len(chunks), available_cpus()) <= 1:
+        # Starting worker processes does not pay off if the files cannot be checked in parallel.
+        incompatible_file = find_incompatible_file(file_paths)
+    else:
+        try:
+            incompatible_file = find_incompatible_file_in_parallel(chunks)
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # Some environments do not support multiprocessing, e.g. due to missing shared memory for semaphores.
+            logging.debug("Checking files in parallel failed, falling back to checking them sequentially.")
+            incompatible_file = find_incompatible_file(file_paths)
+
+    if incompatible_file:
+        logging.debug("At least one file is incompatible with Python 3: " + incompatible_file)
+        logging.debug("Assuming the project in '" + path + "' to be Python 2.")
+        return 2
 
     logging.debug("The project in '" + path + "' seems to be compatible with Python 3.")
     return 3
 
 
 if __name__ == "__main__":
+    # Parse the arguments only here as worker processes might import this module.
+    parser = ArgumentParser()
+    parser.add_argument("-d", "--directory", dest="directory", help="A Python project directory.", metavar="DIR")
+
+    args = parser.parse_args()
+
     dir_path = args.directory
     logging.debug("Trying to determine the required Python version for the project in '" + dir_path + "'.")
     print(project_compatibility(dir_path), end="")